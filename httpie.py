@@ -10,22 +10,103 @@ This module provides functionality to:
 """
 
 import argparse
+import http.client
+import io
 import re
+import select
+import shutil
 import sys
+import threading
 import urllib.request
-from typing import Dict, List, Optional, Tuple
-
-
-# 支持的HTTP方法常量
-SUPPORTED_HTTP_METHODS = {"GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"}
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Callable, Dict, Final, List, Optional, Tuple
+
+
+# 支持的HTTP方法常量（驻留字符串，成员判断可命中同一对象的快速比较）
+SUPPORTED_HTTP_METHODS = frozenset(
+    sys.intern(method)
+    for method in ("GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS")
+)
+
+# 行内的单个空白字符（UTF-8编码下与str.isspace()一致，不含换行符）
+_LINE_SPACE = (
+    rb"(?:[\t\x0b\x0c\r\x1c-\x1f ]|\xc2[\x85\xa0]|\xe1\x9a\x80"
+    rb"|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80)"
+)
+
+# 请求块开头：首行为请求名称，随后第一个“方法 URL”形式的行为请求行
+# （方法不区分大小写，之前的空行、注释行等均被跳过）
+_BLOCK_HEAD_RE = re.compile(
+    rb"(?P<name>[^\n]*)\n"
+    rb"(?:[^\n]*\n)*?"
+    + _LINE_SPACE
+    + rb"*(?P<method>(?i:"
+    + "|".join(sorted(SUPPORTED_HTTP_METHODS)).encode("ascii")
+    + rb")) (?P<url>(?!"
+    + _LINE_SPACE
+    + rb"*(?:\n|\Z))[^\n]*?)"
+    + _LINE_SPACE
+    + rb"*(?:\n|\Z)"
+)
 
 # 默认配置
 DEFAULT_CONFIG = {
     "default_file": "test.http",
-    "encoding": "utf-8",
-    "request_separator": "###",
 }
 
+# 文件与请求/响应体使用的字符编码
+_ENCODING: Final[str] = "utf-8"
+
+# 请求块分隔符（字面量，无需正则）
+_SEPARATOR: Final[bytes] = b"###"
+
+# 流式输出响应体时每次读取的字节数
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# 并发执行请求时的最大线程数
+_MAX_WORKERS = 8
+
+# 幂等的HTTP方法，复用的连接失效时可以安全地重发
+_IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+# 按头部名称序列（“形状”）缓存的输出模板，同形状的请求复用同一模板
+_HEADER_TEMPLATES: Dict[Tuple[str, ...], str] = {}
+
+
+def _strip(data: bytes, leading: bool = True, trailing: bool = True) -> bytes:
+    """
+    按str.strip()的Unicode空白语义去除字节串首尾的空白。
+
+    先按ASCII空白去除，仅当首尾字节可能属于其他空白字符时才解码处理；
+    无法按编码解码的字节原样保留。
+
+    Args:
+        data: 待处理的字节串
+        leading: 是否去除开头的空白
+        trailing: 是否去除末尾的空白
+
+    Returns:
+        去除空白后的字节串
+    """
+    if leading:
+        data = data.lstrip() if not trailing else data.strip()
+    elif trailing:
+        data = data.rstrip()
+    if not data:
+        return data
+    first = data[0]
+    last = data[-1]
+    if (leading and (first >= 0x80 or 0x1C <= first <= 0x1F)) or (
+        trailing and (last >= 0x80 or 0x1C <= last <= 0x1F)
+    ):
+        text = data.decode(_ENCODING, "surrogateescape")
+        if leading:
+            text = text.lstrip()
+        if trailing:
+            text = text.rstrip()
+        data = text.encode(_ENCODING, "surrogateescape")
+    return data
+
 
 class HttpRequest:
     """
@@ -34,37 +115,67 @@ class HttpRequest:
     包含HTTP请求的所有必要信息：请求名称、方法、URL、头部和请求体。
     """
 
+    __slots__ = (
+        "name",
+        "method",
+        "url",
+        "header_keys",
+        "header_values",
+        "body",
+        "_headers",
+    )
+
     def __init__(
-        self, name: str, method: str, url: str, headers: Dict[str, str], body: str
-    ):
+        self,
+        name: str,
+        method: str,
+        url: str,
+        header_keys: List[str],
+        header_values: List[str],
+        body: bytes,
+    ) -> None:
         """
         初始化HTTP请求对象。
 
+        头部以两个平行列表保存（键与值按下标一一对应），
+        按顺序遍历时无需经过哈希表。
+
         Args:
             name: 请求的名称标识
             method: HTTP方法（GET, POST等）
             url: 请求的URL地址
-            headers: HTTP头部字典
-            body: 请求体内容
+            header_keys: HTTP头部名称列表
+            header_values: HTTP头部值列表
+            body: 请求体的字节内容
         """
         self.name = name
-        self.method = method.upper()
+        # 方法种类有限，驻留后各请求共享同一字符串对象
+        self.method = sys.intern(method.upper())
         self.url = url
-        self.headers = headers
+        self.header_keys = header_keys
+        self.header_values = header_values
         self.body = body
+        self._headers: Optional[Dict[str, str]] = None
 
     def __repr__(self) -> str:
         return (
             f"HttpRequest(name='{self.name}', method='{self.method}', url='{self.url}')"
         )
 
+    @property
+    def headers(self) -> Dict[str, str]:
+        """以字典形式返回HTTP头部，首次访问时构建。"""
+        if self._headers is None:
+            self._headers = dict(zip(self.header_keys, self.header_values))
+        return self._headers
+
     def has_body(self) -> bool:
         """检查请求是否包含请求体。"""
-        return bool(self.body.strip())
+        return bool(_strip(self.body))
 
     def get_body_bytes(self) -> bytes:
         """获取请求体的字节表示。"""
-        return self.body.encode(DEFAULT_CONFIG["encoding"]) if self.has_body() else b""
+        return self.body if self.has_body() else b""
 
 
 class HttpFileParser:
@@ -74,7 +185,7 @@ class HttpFileParser:
     支持解析包含多个HTTP请求定义的文件，每个请求由###分隔。
     """
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str) -> None:
         """
         初始化解析器。
 
@@ -97,30 +208,39 @@ class HttpFileParser:
         blocks = self._split_content(content)
 
         requests = []
-        for block in blocks:
-            block = block.strip()
-            if not block:
-                continue
+        try:
+            for block in blocks:
+                block = _strip(block)
+                if not block:
+                    continue
 
-            request = self._parse_block(block)
-            if request:
-                requests.append(request)
+                request = self._parse_block(block)
+                if request:
+                    requests.append(request)
+        except UnicodeDecodeError as e:
+            print(f"Error reading file: {e}")
+            sys.exit(1)
 
         return requests
 
-    def _read_file(self) -> str:
+    def _read_file(self) -> bytes:
         """
-        读取文件内容。
+        以字节形式读取文件内容，解码推迟到提取各字段时进行。
+
+        与文本模式读取一致，\r\n和单独的\r均统一为\n。
 
         Returns:
-            文件的文本内容
+            换行符统一后的文件字节内容
 
         Raises:
             SystemExit: 当文件读取失败时退出程序
         """
         try:
-            with open(self.file_path, "r", encoding=DEFAULT_CONFIG["encoding"]) as f:
-                return f.read()
+            with open(self.file_path, "rb") as f:
+                content = f.read()
+            if b"\r" in content:
+                content = content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            return content
         except FileNotFoundError:
             print(f"Error: File '{self.file_path}' not found.")
             sys.exit(1)
@@ -128,7 +248,7 @@ class HttpFileParser:
             print(f"Error reading file: {e}")
             sys.exit(1)
 
-    def _split_content(self, content: str) -> List[str]:
+    def _split_content(self, content: bytes) -> List[bytes]:
         """
         将文件内容按分隔符分割成请求块。
 
@@ -138,185 +258,164 @@ class HttpFileParser:
         Returns:
             分割后的请求块列表
         """
-        return re.split(DEFAULT_CONFIG["request_separator"], content)
+        return content.split(_SEPARATOR)
 
-    def _parse_block(self, block: str) -> Optional[HttpRequest]:
+    def _parse_block(self, block: bytes) -> Optional[HttpRequest]:
         """
-        解析单个HTTP请求块。
+        单次遍历解析单个HTTP请求块。
+
+        请求名称与请求行由预编译的正则表达式一次匹配得到，
+        其后的头部与请求体共享同一个行迭代器，每一行只被处理一次。
+        解析全程基于字节进行，仅在生成字段值时解码，请求体保持字节形式。
 
         Args:
-            block: 单个请求块的文本内容
+            block: 已去除首尾空白的单个请求块字节内容
 
         Returns:
             解析成功的HttpRequest对象，失败时返回None
-        """
-        all_lines = [line.rstrip() for line in block.split("\n")]
-        non_empty_lines = [line for line in all_lines if line.strip()]
-
-        if not non_empty_lines:
-            return None
-
-        # 提取请求名称
-        name = self._extract_request_name(non_empty_lines)
 
-        # 查找并解析请求行
-        request_line = self._find_request_line(non_empty_lines)
-        if not request_line:
+        Raises:
+            UnicodeDecodeError: 当名称、URL或头部无法按配置的编码解码时
+        """
+        # 块已去除首尾空白，首行即为请求名称
+        match = _BLOCK_HEAD_RE.match(block)
+        if match is None:
             return None
 
-        method, url = self._parse_request_line(request_line)
-
-        # 查找请求行在完整行列表中的位置
-        request_line_index = self._find_request_line_index(all_lines, request_line)
-        if request_line_index is None:
-            return None
+        lines = iter(block[match.end() :].split(b"\n"))
+        header_keys = []
+        header_values = []
+        body_buf = io.BytesIO()
 
-        # 解析头部和请求体
-        headers, body = self._parse_headers_and_body(
-            all_lines[request_line_index + 1 :]
+        # 解析头部，遇到空行或非头部行时结束
+        for line in lines:
+            stripped = _strip(line)
+            if not stripped:  # 遇到空行，切换到请求体部分
+                break
+            # 单次扫描同时完成冒号查找与切分
+            key, sep, value = stripped.partition(b":")
+            if not sep:
+                # 非头部行但未遇到空行分隔符，为兼容性考虑将其视为请求体开始
+                # （请求体首行的行首空白最终也会被去除）
+                body_buf.write(stripped)
+                body_buf.write(b"\n")
+                break
+            header_keys.append(_strip(key, leading=False).decode(_ENCODING))
+            header_values.append(_strip(value, trailing=False).decode(_ENCODING))
+
+        # 剩余各行均属于请求体，保留行首缩进，只去除行尾空白
+        for line in lines:
+            body_buf.write(_strip(line, leading=False))
+            body_buf.write(b"\n")
+
+        return HttpRequest(
+            _strip(match.group("name")).decode(_ENCODING),
+            match.group("method").decode("ascii"),
+            match.group("url").decode(_ENCODING),
+            header_keys,
+            header_values,
+            _strip(body_buf.getvalue()),
         )
 
-        return HttpRequest(name, method, url, headers, body)
 
-    def _extract_request_name(self, non_empty_lines: List[str]) -> str:
-        """
-        从非空行列表中提取请求名称。
-
-        Args:
-            non_empty_lines: 非空行列表
+class ResponseFormatter:
+    """
+    HTTP响应格式化器，负责格式化输出请求和响应信息。
 
-        Returns:
-            请求名称
-        """
-        return non_empty_lines[0].strip()
+    文本输出先写入内部缓冲区，由flush()一次性写到输出目标。
+    """
 
-    def _find_request_line(self, non_empty_lines: List[str]) -> Optional[str]:
+    def __init__(self, out: Optional[BinaryIO] = None) -> None:
         """
-        查找HTTP请求行（包含方法和URL）。
+        初始化格式化器及其输出缓冲区。
 
         Args:
-            non_empty_lines: 非空行列表
-
-        Returns:
-            找到的请求行，未找到时返回None
+            out: 输出目标（二进制流），默认为标准输出
         """
-        if len(non_empty_lines) < 2:
-            return None
+        self._buf = io.StringIO()
+        self._out = out
 
-        for line in non_empty_lines[1:]:
-            line = line.strip()
-            if line and not line.startswith("#"):
-                parts = line.split(" ", 1)
-                if len(parts) == 2 and parts[0].upper() in SUPPORTED_HTTP_METHODS:
-                    return line
-        return None
-
-    def _parse_request_line(self, request_line: str) -> Tuple[str, str]:
+    def _writeln(self, text: str) -> None:
         """
-        解析请求行，提取HTTP方法和URL。
+        向缓冲区写入一行文本。
 
         Args:
-            request_line: 请求行文本
-
-        Returns:
-            (方法, URL)的元组
+            text: 要写入的文本
         """
-        parts = request_line.split(" ", 1)
-        return parts[0].upper(), parts[1]
+        self._buf.write(text)
+        self._buf.write("\n")
 
-    def _find_request_line_index(
-        self, all_lines: List[str], request_line: str
-    ) -> Optional[int]:
+    def flush(self) -> BinaryIO:
         """
-        在完整行列表中查找请求行的索引位置。
-
-        Args:
-            all_lines: 完整行列表（包含空行）
-            request_line: 要查找的请求行
+        将缓冲区内容写到输出目标并清空缓冲区。
 
         Returns:
-            请求行的索引位置，未找到时返回None
+            输出目标，可继续写入字节内容
         """
-        for i, line in enumerate(all_lines):
-            if line.strip() == request_line:
-                return i
-        return None
+        out = self._out
+        if out is None:
+            sys.stdout.flush()
+            out = sys.stdout.buffer
+        text = self._buf.getvalue()
+        out.write(text.encode(sys.stdout.encoding, sys.stdout.errors or "strict"))
+        out.flush()
+        self._buf.seek(0)
+        self._buf.truncate(0)
+        return out
 
-    def _parse_headers_and_body(self, lines: List[str]) -> Tuple[Dict[str, str], str]:
+    def print_request_header(self, request: HttpRequest) -> None:
         """
-        解析HTTP头部和请求体。
+        打印请求头部信息。
 
         Args:
-            lines: 请求行之后的所有行
-
-        Returns:
-            (头部字典, 请求体)的元组
+            request: HTTP请求对象
         """
-        headers = {}
-        body_lines = []
-        in_headers = True
-
-        for line in lines:
-            if in_headers:
-                if not line.strip():  # 遇到空行，切换到请求体部分
-                    in_headers = False
-                    continue
-                # 解析头部行
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    headers[key.strip()] = value.strip()
-                else:
-                    # 非头部行但未遇到空行分隔符，为兼容性考虑将其视为请求体开始
-                    in_headers = False
-                    body_lines.append(line)
-            else:
-                # 请求体部分
-                body_lines.append(line)
+        self._writeln(f"\n===== {request.name} =====")
+        self._writeln(f"{request.method} {request.url}")
 
-        body = "\n".join(body_lines).strip()
-        return headers, body
-
-
-class ResponseFormatter:
-    """
-    HTTP响应格式化器，负责格式化输出请求和响应信息。
-    """
-
-    @staticmethod
-    def print_request_header(request: HttpRequest) -> None:
+    def print_request_headers(self, keys: List[str], values: List[str]) -> None:
         """
-        打印请求头部信息。
+        打印请求头部字段。
+
+        头部名称序列相同的请求共用一个预先生成的格式模板，
+        一次format调用即可输出全部头部。
 
         Args:
-            request: HTTP请求对象
+            keys: 头部名称列表
+            values: 头部值列表
         """
-        print(f"\n===== {request.name} =====")
-        print(f"{request.method} {request.url}")
+        if not keys:
+            return
 
-    @staticmethod
-    def print_request_headers(headers: Dict[str, str]) -> None:
+        shape = tuple(keys)
+        template = _HEADER_TEMPLATES.get(shape)
+        if template is None:
+            template = "".join(
+                key.replace("{", "{{").replace("}", "}}") + ": {}\n" for key in shape
+            )
+            _HEADER_TEMPLATES[shape] = template
+        self._buf.write(template.format(*values))
+
+    def print_content_length(self, length: int) -> None:
         """
-        打印请求头部字段。
+        打印自动添加的Content-Length头部。
 
         Args:
-            headers: 头部字典
+            length: 请求体字节数
         """
-        for key, value in headers.items():
-            print(f"{key}: {value}")
+        self._writeln(f"Content-Length: {length}")
 
-    @staticmethod
-    def print_request_body(body: str) -> None:
+    def print_request_body(self, body: bytes) -> None:
         """
         打印请求体。
 
         Args:
-            body: 请求体内容
+            body: 请求体的字节内容
         """
         if body:
-            print(f"\n{body}")
+            self.flush().write(b"\n" + body + b"\n")
 
-    @staticmethod
-    def print_response_header(status: int, reason: str) -> None:
+    def print_response_header(self, status: int, reason: str) -> None:
         """
         打印响应状态行。
 
@@ -324,11 +423,10 @@ class ResponseFormatter:
             status: HTTP状态码
             reason: 状态描述
         """
-        print(f"\n----------")
-        print(f"{status} {reason}")
+        self._writeln("\n----------")
+        self._writeln(f"{status} {reason}")
 
-    @staticmethod
-    def print_response_headers(headers) -> None:
+    def print_response_headers(self, headers: http.client.HTTPMessage) -> None:
         """
         打印响应头部字段。
 
@@ -336,20 +434,24 @@ class ResponseFormatter:
             headers: 响应头部对象
         """
         for key, value in headers.items():
-            print(f"{key}: {value}")
+            self._writeln(f"{key}: {value}")
 
-    @staticmethod
-    def print_response_body(body: str) -> None:
+    def print_response_body(self, stream: BinaryIO) -> None:
         """
-        打印响应体。
+        以流式方式打印响应体，无需将整个响应体读入内存。
 
         Args:
-            body: 响应体内容
+            stream: 可读取响应体字节的对象
         """
-        print(f"\n{body}")
+        out = self.flush()
+        out.write(b"\n")
+        shutil.copyfileobj(stream, out, _STREAM_CHUNK_SIZE)
+        out.write(b"\n")
+        out.flush()
 
-    @staticmethod
-    def print_error(error_type: str, message: str, error_body: str = None) -> None:
+    def print_error(
+        self, error_type: str, message: str, error_body: Optional[str] = None
+    ) -> None:
         """
         打印错误信息。
 
@@ -358,9 +460,151 @@ class ResponseFormatter:
             message: 错误消息
             error_body: 错误响应体（可选）
         """
-        print(f"\n{error_type}: {message}")
+        self._writeln(f"\n{error_type}: {message}")
         if error_body:
-            print(f"Error Response: {error_body}")
+            self._writeln(f"Error Response: {error_body}")
+
+
+class KeepAliveHandler(urllib.request.HTTPHandler, urllib.request.HTTPSHandler):
+    """
+    支持长连接的HTTP/HTTPS处理器。
+
+    标准处理器每个请求都会新建TCP（及TLS）连接并强制`Connection: close`，
+    本处理器按主机缓存http.client连接，在多个请求之间复用。
+    调用方需在发起下一个请求前读完上一个响应。
+    """
+
+    def __init__(self) -> None:
+        """初始化处理器及连接缓存。"""
+        super().__init__()
+        self._connections: Dict[
+            Tuple[Callable[..., http.client.HTTPConnection], str],
+            http.client.HTTPConnection,
+        ] = {}
+
+    def do_open(
+        self,
+        http_class: Callable[..., http.client.HTTPConnection],
+        req: urllib.request.Request,
+        **http_conn_args: Any,
+    ) -> http.client.HTTPResponse:
+        """
+        发送请求并返回响应，优先复用同一主机的已有连接。
+
+        Args:
+            http_class: http.client中的连接类
+            req: urllib请求对象
+            http_conn_args: 创建连接时的附加参数
+
+        Returns:
+            HTTP响应对象
+        """
+        # 经代理隧道的请求交由标准实现处理
+        if getattr(req, "_tunnel_host", None):
+            return super().do_open(http_class, req, **http_conn_args)
+
+        host = req.host
+        if not host:
+            raise urllib.error.URLError("no host given")
+
+        headers = dict(req.unredirected_hdrs)
+        headers.update({k: v for k, v in req.headers.items() if k not in headers})
+        headers = {name.title(): value for name, value in headers.items()}
+
+        key = (http_class, host)
+        conn = self._connections.pop(key, None)
+        if conn is not None and self._is_stale(conn):
+            # 发送前即发现服务器已关闭空闲连接，直接改用新连接
+            conn.close()
+            conn = None
+
+        if conn is not None:
+            sent = False
+            try:
+                self._send_request(conn, req, headers)
+                sent = True
+                response = conn.getresponse()
+            except (http.client.HTTPException, ConnectionError) as err:
+                conn.close()
+                # 请求写出后才失败时服务器可能已处理该请求，非幂等请求不能重发
+                if sent and req.get_method() not in _IDEMPOTENT_METHODS:
+                    raise urllib.error.URLError(err)
+                conn = None
+            except OSError as err:
+                conn.close()
+                raise urllib.error.URLError(err)
+            except BaseException:
+                conn.close()
+                raise
+
+        if conn is None:
+            # 未设置超时时req.timeout为socket模块的哨兵对象，并非float
+            timeout = getattr(req, "timeout")
+            conn = http_class(host, timeout=timeout, **http_conn_args)
+            try:
+                self._send_request(conn, req, headers)
+                response = conn.getresponse()
+            except OSError as err:
+                conn.close()
+                raise urllib.error.URLError(err)
+            except BaseException:
+                conn.close()
+                raise
+
+        self._connections[key] = conn
+        response.url = req.get_full_url()
+        # urllib期望msg属性为状态描述（而非头部），与标准处理器保持一致
+        setattr(response, "msg", response.reason)
+        return response
+
+    def close(self) -> None:
+        """关闭所有缓存的连接。"""
+        for conn in self._connections.values():
+            conn.close()
+        self._connections.clear()
+
+    @staticmethod
+    def _is_stale(conn: http.client.HTTPConnection) -> bool:
+        """
+        检查空闲连接是否已失效。
+
+        空闲连接上不应有可读数据，可读通常意味着对端已关闭连接。
+
+        Args:
+            conn: HTTP连接对象
+
+        Returns:
+            连接已失效时返回True
+        """
+        if conn.sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([conn.sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+    @staticmethod
+    def _send_request(
+        conn: http.client.HTTPConnection,
+        req: urllib.request.Request,
+        headers: Dict[str, str],
+    ) -> None:
+        """
+        在指定连接上写出请求。
+
+        Args:
+            conn: HTTP连接对象
+            req: urllib请求对象
+            headers: 已规范化的请求头部
+        """
+        conn.request(
+            req.get_method(),
+            req.selector,
+            req.data,
+            headers,
+            encode_chunked=req.has_header("Transfer-encoding"),
+        )
 
 
 class HttpExecutor:
@@ -368,7 +612,7 @@ class HttpExecutor:
     HTTP请求执行器，负责执行HTTP请求并处理响应。
     """
 
-    def __init__(self, formatter: ResponseFormatter = None):
+    def __init__(self, formatter: Optional[ResponseFormatter] = None) -> None:
         """
         初始化执行器。
 
@@ -376,6 +620,9 @@ class HttpExecutor:
             formatter: 响应格式化器，默认使用ResponseFormatter
         """
         self.formatter = formatter or ResponseFormatter()
+        # 所有请求共享同一个opener，以便复用连接
+        self._keep_alive = KeepAliveHandler()
+        self._opener = urllib.request.build_opener(self._keep_alive)
 
     def execute(self, request: HttpRequest) -> None:
         """
@@ -384,54 +631,105 @@ class HttpExecutor:
         Args:
             request: 要执行的HTTP请求对象
         """
-        self.formatter.print_request_header(request)
-
-        # 准备请求
-        headers, body_bytes = self._prepare_request(request)
-        req = self._create_urllib_request(request, headers, body_bytes)
-
-        # 打印请求详情
-        self.formatter.print_request_headers(headers)
-        self.formatter.print_request_body(request.body)
-
-        # 执行请求
-        self._execute_request(req)
+        formatter = self.formatter
+        # 无论在哪一步出错，已缓冲的输出都要写出
+        try:
+            formatter.print_request_header(request)
+
+            # 准备请求
+            body_bytes = request.get_body_bytes()
+            header_keys, header_values = self._resolve_headers(request, body_bytes)
+            req = self._create_urllib_request(
+                request, header_keys, header_values, body_bytes
+            )
+
+            # 打印请求详情（与实际发送的头部一致）
+            formatter.print_request_headers(header_keys, header_values)
+            if body_bytes:
+                formatter.print_content_length(len(body_bytes))
+            formatter.print_request_body(request.body)
+
+            # 执行请求
+            self._execute_request(req)
+        finally:
+            formatter.flush()
+
+    def close(self) -> None:
+        """关闭执行器持有的所有连接。"""
+        self._keep_alive.close()
 
-    def _prepare_request(self, request: HttpRequest) -> Tuple[Dict[str, str], bytes]:
+    @staticmethod
+    def _resolve_headers(
+        request: HttpRequest, body_bytes: bytes
+    ) -> Tuple[List[str], List[str]]:
         """
-        准备HTTP请求的头部和请求体。
+        确定实际发送的头部（不含自动添加的Content-Length）。
+
+        与urllib一致，头部名称不区分大小写，重复的头部只保留最后一个值；
+        有请求体时文件中的Content-Length被自动计算的值取代。
+        没有需要去除的头部时直接返回请求自身的列表，不做复制。
 
         Args:
             request: HTTP请求对象
+            body_bytes: 请求体字节
 
         Returns:
-            (头部字典, 请求体字节)的元组
-        """
-        headers = request.headers.copy()
-        body_bytes = request.get_body_bytes()
-
-        # 如果有请求体，自动添加Content-Length头部
-        if request.has_body():
-            headers["Content-Length"] = str(len(body_bytes))
-
-        return headers, body_bytes
+            (头部名称列表, 头部值列表)的元组
+        """
+        keys = request.header_keys
+        values = request.header_values
+        names = [key.capitalize() for key in keys]
+        unique = set(names)
+        if len(unique) == len(names) and not (
+            body_bytes and "Content-length" in unique
+        ):
+            return keys, values
+
+        positions: Dict[str, int] = {}
+        resolved_keys: List[str] = []
+        resolved_values: List[str] = []
+        for key, name, value in zip(keys, names, values):
+            if body_bytes and name == "Content-length":
+                continue
+            index = positions.get(name)
+            if index is None:
+                positions[name] = len(resolved_keys)
+                resolved_keys.append(key)
+                resolved_values.append(value)
+            else:
+                resolved_values[index] = value
+        return resolved_keys, resolved_values
 
     def _create_urllib_request(
-        self, request: HttpRequest, headers: Dict[str, str], body_bytes: bytes
+        self,
+        request: HttpRequest,
+        header_keys: List[str],
+        header_values: List[str],
+        body_bytes: bytes,
     ) -> urllib.request.Request:
         """
         创建urllib.request.Request对象。
 
+        头部列表按原样逐个添加，不复制也不修改。
+
         Args:
             request: HTTP请求对象
-            headers: 头部字典
+            header_keys: 头部名称列表
+            header_values: 头部值列表
             body_bytes: 请求体字节
 
         Returns:
             配置好的urllib.request.Request对象
         """
-        req = urllib.request.Request(request.url, data=body_bytes, headers=headers)
-        req.get_method = lambda: request.method
+        req = urllib.request.Request(
+            request.url, data=body_bytes, method=request.method
+        )
+        for key, value in zip(header_keys, header_values):
+            req.add_header(key, value)
+
+        # 如果有请求体，自动添加Content-Length头部
+        if body_bytes:
+            req.add_unredirected_header("Content-Length", str(len(body_bytes)))
         return req
 
     def _execute_request(self, req: urllib.request.Request) -> None:
@@ -442,7 +740,7 @@ class HttpExecutor:
             req: 配置好的urllib.request.Request对象
         """
         try:
-            with urllib.request.urlopen(req) as response:
+            with self._opener.open(req) as response:
                 self._handle_successful_response(response)
         except urllib.error.HTTPError as e:
             self._handle_http_error(e)
@@ -451,7 +749,7 @@ class HttpExecutor:
         except Exception as e:
             self._handle_general_error(e)
 
-    def _handle_successful_response(self, response) -> None:
+    def _handle_successful_response(self, response: http.client.HTTPResponse) -> None:
         """
         处理成功的HTTP响应。
 
@@ -460,9 +758,7 @@ class HttpExecutor:
         """
         self.formatter.print_response_header(response.status, response.reason)
         self.formatter.print_response_headers(response.headers)
-
-        response_body = response.read().decode(DEFAULT_CONFIG["encoding"])
-        self.formatter.print_response_body(response_body)
+        self.formatter.print_response_body(response)
 
     def _handle_http_error(self, error: urllib.error.HTTPError) -> None:
         """
@@ -473,7 +769,7 @@ class HttpExecutor:
         """
         error_body = None
         try:
-            error_body = error.read().decode(DEFAULT_CONFIG["encoding"])
+            error_body = error.read().decode(_ENCODING)
         except:
             pass
 
@@ -522,6 +818,11 @@ class ArgumentParser:
             help=f"HTTP definition file (default: {DEFAULT_CONFIG['default_file']})",
         )
         parser.add_argument("--case", help="Specific request case to execute")
+        parser.add_argument(
+            "--parallel",
+            action="store_true",
+            help="Execute requests concurrently (output keeps file order)",
+        )
         return parser
 
     @staticmethod
@@ -600,7 +901,7 @@ def load_requests(file_path: str) -> List[HttpRequest]:
 
 
 def filter_requests(
-    requests: List[HttpRequest], case_name: str = None
+    requests: List[HttpRequest], case_name: Optional[str] = None
 ) -> List[HttpRequest]:
     """
     根据条件过滤请求。
@@ -624,16 +925,61 @@ def filter_requests(
     return filtered_requests
 
 
-def execute_requests(requests: List[HttpRequest]) -> None:
+def execute_requests(requests: List[HttpRequest], parallel: bool = False) -> None:
     """
     执行HTTP请求列表。
 
     Args:
         requests: 要执行的HTTP请求列表
+        parallel: 是否并发执行（请求之间互不依赖时使用）
     """
+    if parallel and len(requests) > 1:
+        execute_requests_parallel(requests)
+        return
+
     executor = HttpExecutor()
-    for request in requests:
+    try:
+        for request in requests:
+            executor.execute(request)
+    finally:
+        executor.close()
+
+
+def execute_requests_parallel(requests: List[HttpRequest]) -> None:
+    """
+    使用线程池并发执行HTTP请求列表。
+
+    每个工作线程持有各自的执行器（及其长连接），每个请求的输出先写入
+    独立的缓冲区，再按请求在文件中的顺序依次写到标准输出。
+
+    Args:
+        requests: 要执行的HTTP请求列表
+    """
+    local = threading.local()
+    executors: List[HttpExecutor] = []
+
+    def run(request: HttpRequest) -> bytes:
+        executor = getattr(local, "executor", None)
+        if executor is None:
+            executor = local.executor = HttpExecutor()
+            executors.append(executor)
+
+        out = io.BytesIO()
+        executor.formatter = ResponseFormatter(out)
         executor.execute(request)
+        return out.getvalue()
+
+    try:
+        with ThreadPoolExecutor(min(_MAX_WORKERS, len(requests))) as pool:
+            futures = [pool.submit(run, request) for request in requests]
+            for future in futures:
+                output = future.result()
+                sys.stdout.flush()
+                sys.stdout.buffer.write(output)
+                sys.stdout.buffer.flush()
+    finally:
+        for executor in executors:
+            executor.close()
 
 
 def main() -> None:
@@ -665,7 +1011,7 @@ def main() -> None:
         return
 
     # 执行请求
-    execute_requests(filtered_requests)
+    execute_requests(filtered_requests, args.parallel)
 
 
 if __name__ == "__main__":